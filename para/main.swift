@@ -34,14 +34,13 @@ struct Para: ParsableCommand {
 
 // MARK: Make changes
 extension Para {
-    enum FolderType: String, ExpressibleByArgument {
+    enum FolderType: String, ExpressibleByArgument, CaseIterable {
         case project, area
     }
 
     struct Create: ParsableCommand {
-        static var configuration = CommandConfiguration(abstract: "Create a new project or area. Org category in-file metadata will be set based on the name")
-        @Argument(help: "Type of folder to create (project or area)",
-                  completion: CompletionKind.list(["project", "area"]))
+        static let configuration = CommandConfiguration(abstract: "Create a new project or area. Org category in-file metadata will be set based on the name")
+        @Argument(help: "Type of folder to create")
         var type: FolderType // Changed to Enum
         @Argument(help: "Name of the folder") var name: String
         @Flag(inversion: .prefixedNo, help: "Provide additional details on success.") var verbose = false
@@ -54,12 +53,12 @@ extension Para {
         }
 
         func run() throws {
-            let folderPath = Para.getParaFolderPath(type: type.rawValue, name: name)
+            let folderPath = try Para.getParaFolderPath(type: type.rawValue, name: name)
             Para.createFolder(at: folderPath)
             Para.createFile(at: "\(folderPath)/.projectile", content: "")
 
             let journalContent = "#+TITLE: \(name.capitalized) \(type.rawValue.capitalized) Journal\n#+CATEGORY: \(name.capitalized)"
-            Para.createFile(at: "\(folderPath)/journal.org", content: journalContent)
+            Para.createFile(at: "\(folderPath)/\(Para.journalFileName)", content: journalContent)
 
             if verbose {
                 print("\(type.rawValue.capitalized) created successfully.")
@@ -67,42 +66,32 @@ extension Para {
 
             // Open the .org file in the associated app if openOnCreate is true
             if openOnCreate {
-                if let url = URL(string: "file://" + "\(folderPath)/journal.org") {
-                    NSWorkspace.shared.open(url)
-                }
+                Para.openJournal(in: folderPath)
             }
         }
     }
 
     struct Archive: ParsableCommand {
-        static var configuration = CommandConfiguration(abstract: "Archive an existing project or area.")
+        static let configuration = CommandConfiguration(abstract: "Archive an existing project or area.")
 
         @Argument(
-            help: "Type of folder to archive (project or area)",
-            completion: CompletionKind.list(["project", "area"])
+            help: "Type of folder to archive"
         )
         var type: FolderType
 
         @Argument(
             help: "Name of the folder",
-            completion: CompletionKind.custom { _ in
-                if CommandLine.arguments.contains("project") {
-                    return Para.completeFolders(type: "project")
-                }
-                if CommandLine.arguments.contains("area") {
-                    return Para.completeFolders(type: "area")
-                }
-                return []
-            }
+            completion: Para.folderNameCompletion
         )
         var name: String
 
         @Flag(inversion: .prefixedNo, help: "Provide additional details on success.") var verbose = false
 
-        func run() {
-            let fromPath: String = Para.getParaFolderPath(type: type.rawValue, name: name)
-            let homeDir: String = FileManager.default.homeDirectoryForCurrentUser.path
-            let toPath: String = Para.getArchiveFolderPath(name: name) ?? "\(homeDir)/Documents/archive/\(name)"
+        func run() throws {
+            let fromPath: String = try Para.getParaFolderPath(type: type.rawValue, name: name)
+            // The home directory is only needed when PARA_ARCHIVE is unset, and ?? evaluates it lazily
+            let toPath: String = Para.getArchiveFolderPath(name: name)
+                ?? "\(FileManager.default.homeDirectoryForCurrentUser.path)/Documents/archive/\(name)"
 
             Para.moveToArchive(from: fromPath, to: toPath)
 
@@ -116,33 +105,23 @@ extension Para {
         static let configuration = CommandConfiguration(abstract: "Delete a project or area")
 
         @Argument(
-            help: "Type of folder to delete (project or area)",
-            completion: CompletionKind.list(["project", "area"])
+            help: "Type of folder to delete"
         )
         var type: FolderType        
 
         @Argument(
             help: "Name of the folder",
-            completion: CompletionKind.custom { _ in
-                if CommandLine.arguments.contains("project") {
-                    return Para.completeFolders(type: "project")
-                }
-                if CommandLine.arguments.contains("area") {
-                    return Para.completeFolders(type: "area")
-                }
-                return []
-            }
+            completion: Para.folderNameCompletion
         )
         var name: String
 
         @Flag(inversion: .prefixedNo, help: "Provide additional details on success.") var verbose = false
 
         func run() throws {
-            let folderPath = Para.getParaFolderPath(type: type.rawValue, name: name)
-            let expandedPath = (folderPath as NSString).expandingTildeInPath
+            let folderPath = try Para.getParaFolderPath(type: type.rawValue, name: name)
 
             do {
-                try Para.deleteDirectory(at: expandedPath)
+                try Para.deleteDirectory(at: folderPath)
             } catch let error {
                 print("Error: \(error.localizedDescription)")
             }
@@ -150,10 +129,9 @@ extension Para {
     }
 
     struct List: ParsableCommand {
-        static var configuration = CommandConfiguration(abstract: "List existing Projects or Areas.")
+        static let configuration = CommandConfiguration(abstract: "List existing Projects or Areas.")
 
-        @Argument(help: "Type of folder to list (project or area)",
-                  completion: CompletionKind.list(["project", "area"]))
+        @Argument(help: "Type of folder to list")
         var type: FolderType
 
         func run() {
@@ -173,48 +151,45 @@ extension Para {
         static let configuration = CommandConfiguration(abstract: "Open a project or area")
 
         @Argument(
-            help: "Type of folder to open (project or area)",
-            completion: CompletionKind.list(["project", "area"])
+            help: "Type of folder to open"
         )
         var type: FolderType
 
         @Argument(
             help: "Name of the folder",
-            completion: CompletionKind.custom { _ in
-                if CommandLine.arguments.contains("project") {
-                    return Para.completeFolders(type: "project")
-                }
-                if CommandLine.arguments.contains("area") {
-                    return Para.completeFolders(type: "area")
-                }
-                return []
-            }
+            completion: Para.folderNameCompletion
         )
         var name: String
 
         @Flag(inversion: .prefixedNo, help: "Provide additional details on success.") var verbose = false
 
         func run() throws {
-            let folderPath = Para.getParaFolderPath(type: type.rawValue, name: name)
-            let expandedPath = (folderPath as NSString).expandingTildeInPath
+            let folderPath = try Para.getParaFolderPath(type: type.rawValue, name: name)
+            Para.openJournal(in: folderPath)
+        }
+    }
+}
 
-            if let url = URL(string: "file://" + "\(folderPath)/journal.org") {
-                NSWorkspace.shared.open(url)
-            }
+// MARK: Completions
+extension Para {
+    // Shared by every subcommand that takes an existing folder name, so the
+    // completion is built once rather than once per argument declaration.
+    static let folderNameCompletion = CompletionKind.custom { _ in
+        let arguments = CommandLine.arguments
+        guard let type = FolderType.allCases.first(where: { arguments.contains($0.rawValue) }) else {
+            return []
         }
+        return Para.completeFolders(type: type.rawValue)
     }
 }
 
 // MARK: Helpers
 extension Para {
-    static func getParaFolderPath(type: String, name: String) -> String {
-        if let paraHome = ProcessInfo.processInfo.environment["PARA_HOME"] {
-            return "\(paraHome)/\(type)s/\(name)"
-        } else {
-            // Fallback or error handling
-            print("Error: PARA_HOME is not set.")
-            return ""
+    static func getParaFolderPath(type: String, name: String) throws -> String {
+        guard let paraHome = ProcessInfo.processInfo.environment["PARA_HOME"] else {
+            throw ValidationError("PARA_HOME is not set.")
         }
+        return "\(paraHome)/\(type)s/\(name)"
     }
 
     static func getArchiveFolderPath(name: String) -> String? {
@@ -249,6 +224,14 @@ extension Para {
         }
     }
 
+    static let journalFileName = "journal.org"
+
+    static func openJournal(in folderPath: String) {
+        let url = URL(fileURLWithPath: folderPath, isDirectory: true)
+            .appendingPathComponent(journalFileName, isDirectory: false)
+        NSWorkspace.shared.open(url)
+    }
+
     static func deleteDirectory(at path: String) throws {
         let expandedPath = (path as NSString).expandingTildeInPath
         if FileManager.default.fileExists(atPath: expandedPath) {